@@ -8,13 +8,19 @@ from typing import TYPE_CHECKING, cast
 from homeassistant.const import CONF_MAC, CONF_NAME, Platform
 
 from .const import (
+    CONF_CONNECTION_TIMEOUT,
     CONF_DEVICE_TYPE,
+    CONF_ENABLE_INFO_SENSORS,
+    CONF_INFO_SCAN_INTERVAL,
     CONF_PAIR_ID,
     CONF_POWER_STATE_SCAN_INTERVAL,
+    DEFAULT_CONNECTION_TIMEOUT,
+    DEFAULT_ENABLE_INFO_SENSORS,
+    DEFAULT_INFO_SCAN_INTERVAL,
     DEFAULT_POWER_STATE_SCAN_INTERVAL,
     DOMAIN,
 )
-from .coordinator import BasestationCoordinator
+from .coordinator import BasestationCoordinator, BasestationInfoCoordinator
 from .device import BasestationDevice, get_basestation_device
 from .services import async_setup_services
 
@@ -36,8 +42,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device_type = cast("str", entry.data.get(CONF_DEVICE_TYPE))
     pair_id = entry.data.get(CONF_PAIR_ID)
 
-    # Get scan interval from options or defaults
+    # Get scan intervals from options or defaults
     scan_interval = entry.options.get(CONF_POWER_STATE_SCAN_INTERVAL, DEFAULT_POWER_STATE_SCAN_INTERVAL)
+    info_scan_interval = entry.options.get(CONF_INFO_SCAN_INTERVAL, DEFAULT_INFO_SCAN_INTERVAL)
+    enable_info_sensors = entry.options.get(CONF_ENABLE_INFO_SENSORS, DEFAULT_ENABLE_INFO_SENSORS)
+    connection_timeout = entry.options.get(CONF_CONNECTION_TIMEOUT, DEFAULT_CONNECTION_TIMEOUT)
 
     if mac:
         device = get_basestation_device(
@@ -46,16 +55,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             name=name,
             device_type=device_type,
             pair_id=pair_id,
+            connection_timeout=connection_timeout,
         )
 
-        # Setup Coordinator
+        # Setup Coordinators
         coordinator = BasestationCoordinator(hass, device, scan_interval)
+        info_coordinator = BasestationInfoCoordinator(hass, device, info_scan_interval) if enable_info_sensors else None
 
-        # Initial refresh
+        # Initial refresh; the info sensors do not gate setup, so their first read runs in the background.
+        # It starts only after the power read, which would otherwise find the device busy and skip. If it
+        # still finds the device busy or cooling down, the info sensors stay unavailable and it retries shortly.
         await coordinator.async_config_entry_first_refresh()
-
-        # Store device and coordinator
-        hass.data[DOMAIN][entry.entry_id] = {"device": device, "coordinator": coordinator}
+        if info_coordinator is not None:
+            entry.async_create_background_task(
+                hass, info_coordinator.async_refresh(), f"{DOMAIN}_{mac}_info_refresh", eager_start=True
+            )
+
+        # Store device and coordinators
+        hass.data[DOMAIN][entry.entry_id] = {
+            "device": device,
+            "coordinator": coordinator,
+            "info_coordinator": info_coordinator,
+        }
 
     # Register update listener
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -34,17 +34,16 @@ async def async_setup_entry(
 class BasestationIdentifyButton(CoordinatorEntity, ButtonEntity):
     """Button to identify the basestation by blinking its LED."""
 
-    def __init__(self, coordinator: BasestationCoordinator, device: BasestationDevice) -> None:
+    def __init__(self, coordinator: BasestationCoordinator, device: ValveBasestationDevice) -> None:
         """Initialize the identify button."""
         super().__init__(coordinator)
         self._device = device
-        self._attr_unique_id = f"basestation_{device.mac}_identify"
+        self._attr_unique_id = device.uid_prefix + "identify"
         self._attr_has_entity_name = True
         self._attr_name = "Identify"
         self._attr_icon = "mdi:led-on"
-        self._attr_device_info = {"identifiers": {(DOMAIN, device.mac)}}
+        self._attr_device_info = device.device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        if isinstance(self._device, ValveBasestationDevice):
-            await self._device.identify()
+        await self._device.identify()
@@ -6,9 +6,10 @@ import datetime
 import logging
 from typing import TYPE_CHECKING, Any
 
+from bleak.exc import BleakError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import DOMAIN, INFO_RETRY_SCAN_INTERVAL, MAX_POWER_STATE_SCAN_INTERVAL
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -29,24 +30,74 @@ class BasestationCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Initialize the coordinator."""
         self.device = device
+        self._base_interval = datetime.timedelta(seconds=scan_interval)
+        self._max_interval = max(self._base_interval, datetime.timedelta(seconds=MAX_POWER_STATE_SCAN_INTERVAL))
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{device.mac}",
-            update_interval=datetime.timedelta(seconds=scan_interval),
+            update_interval=self._base_interval,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the device."""
+        previous_state = self.data["last_power_state"] if self.data else None
+        previous_update = self.device.last_power_state_update
         try:
             # Dies führt das eigentliche BLE-Polling durch
             await self.device.update()
-        except Exception as err:
+        except (BleakError, TimeoutError) as err:
             msg = f"Error communicating with basestation: {err}"
             raise UpdateFailed(msg) from err
         else:
+            self._adapt_update_interval(previous_state, previous_update)
             return {
                 "is_on": self.device.is_on,
                 "available": self.device.available,
                 "last_power_state": self.device.last_power_state,
             }
+
+    def _adapt_update_interval(self, previous_state: int | None, previous_update: float) -> None:
+        """Double the polling interval while the power state holds steady and reset it on change."""
+        # Skipped or failed reads leave the state untouched; that is no evidence of a steady state
+        fresh_reading = self.device.last_power_state_update != previous_update
+        if not fresh_reading or self.device.last_power_state != previous_state:
+            self.update_interval = self._base_interval
+        elif self.update_interval is not None:
+            self.update_interval = min(self.update_interval * 2, self._max_interval)
+
+
+class BasestationInfoCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching the static device information from the basestation."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        device: BasestationDevice,
+        scan_interval: int,
+    ) -> None:
+        """Initialize the info coordinator."""
+        self.device = device
+        self._scan_interval = datetime.timedelta(seconds=scan_interval)
+        # Poll on a short interval until every info sensor has a value
+        self._retry_interval = min(self._scan_interval, datetime.timedelta(seconds=INFO_RETRY_SCAN_INTERVAL))
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{device.mac}_info",
+            update_interval=self._retry_interval,
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch device information from the device."""
+        # The coordinator owns the refresh cadence, so bypass the device-side read throttle.
+        # Failed, skipped and cooldown reads return the cached info rather than raising.
+        info = await self.device.read_device_info(force=True)
+        if not self.device.has_device_info:
+            self.update_interval = self._retry_interval
+            msg = f"Device info for {self.device.mac} has not been read yet"
+            raise UpdateFailed(msg)
+
+        complete = info.keys() >= set(self.device.sensor_keys())
+        self.update_interval = self._scan_interval if complete else self._retry_interval
+        return dict(info)
@@ -2,23 +2,28 @@
 
 import asyncio
 import logging
+import random
 import struct
-import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Literal, cast, overload
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast, overload
 
 from attr import dataclass
 from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
-from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+from bleak_retry_connector import BleakClientWithServiceCache, BleakNotFoundError, establish_connection
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
     DEFAULT_CONNECTION_TIMEOUT,
     DEFAULT_INFO_SCAN_INTERVAL,
     DEVICE_TYPE_V1,
     DEVICE_TYPE_V2,
+    DOMAIN,
     FIRMWARE_CHARACTERISTIC,
     HARDWARE_CHARACTERISTIC,
     MANUFACTURER_CHARACTERISTIC,
@@ -49,6 +54,9 @@ MAX_CONSECUTIVE_FAILURES = 5
 EXTENDED_COOLDOWN = 30.0
 MIN_FAILURES_FOR_UNAVAILABLE = 3
 STATE_FRESHNESS_THRESHOLD = 10.0
+CONNECTION_IDLE_TIMEOUT = 5.0
+MAX_RETRY_DELAY = 5.0
+POLL_TIMEOUT = 5.0  # Lower bound of the scheduled power poll time limit
 
 type BaseStationDeviceInfoKey = Literal["firmware", "model", "hardware", "manufacturer", "channel", "pair_id"]
 
@@ -59,6 +67,8 @@ class BLEOperationRead:
 
     characteristic_uuid: str
     retry: bool = True
+    # Per-attempt time limit, capped at the device's connection timeout; None uses that timeout
+    timeout: float | None = None
 
 
 @dataclass(repr=False)
@@ -69,11 +79,18 @@ class BLEOperationWrite:
     value: bytes
     retry: bool = True
     without_response: bool = False
+    timeout: float | None = None
 
 
 class BasestationDevice(ABC):
     """Base class for basestation devices."""
 
+    # Device info keys exposed as sensors and whether the power state can be read back
+    INFO_KEYS: ClassVar[tuple[BaseStationDeviceInfoKey, ...]] = ("firmware", "model", "hardware", "manufacturer")
+    HAS_POWER_STATE: ClassVar[bool] = False
+    # Info keys that can change while the device runs; all others are read once and then kept
+    VOLATILE_INFO_KEYS: ClassVar[frozenset[BaseStationDeviceInfoKey]] = frozenset()
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -84,6 +101,8 @@ class BasestationDevice(ABC):
         """Initialize the device."""
         self.hass = hass
         self.mac = mac
+        # Shared prefix for the unique IDs of this device's secondary entities
+        self.uid_prefix = f"basestation_{mac}_"
         self.custom_name = name
         self.connection_timeout = connection_timeout
         self._is_on = False
@@ -102,12 +121,23 @@ class BasestationDevice(ABC):
 
         self._current_client: BleakClientWithServiceCache | None = None
         self._client_lock = asyncio.Lock()
+        self._connection_users = 0
+        self._idle_disconnect: asyncio.TimerHandle | None = None
+        # Reads currently in flight, keyed by what they read, so concurrent callers share one round-trip
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        # Set by cleanup(); a closed device makes no further connections
+        self._closed = False
 
     @property
     def device_name(self) -> str:
         """Return the name of the device."""
         return self.custom_name or self.default_name
 
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device registry link shared by all entities of this device."""
+        return DeviceInfo(identifiers={(DOMAIN, self.mac)})
+
     @property
     def is_on(self) -> bool:
         """Return if device is on or not."""
@@ -123,12 +153,22 @@ class BasestationDevice(ABC):
         """Return the last known power state value."""
         return self._last_power_state
 
+    @property
+    def has_device_info(self) -> bool:
+        """Return True once a device info read has completed."""
+        return self._device_info_read_success
+
+    @property
+    def last_power_state_update(self) -> float:
+        """Return the loop time the power state was last read or set."""
+        return self._last_power_state_update
+
     @property
     def has_fresh_state(self) -> bool:
         """Return True if we have a recent power state."""
         if self._last_power_state is None:
             return False
-        age = time.time() - self._last_power_state_update
+        age = self.hass.loop.time() - self._last_power_state_update
         return age < STATE_FRESHNESS_THRESHOLD
 
     @property
@@ -148,6 +188,10 @@ class BasestationDevice(ABC):
     async def update(self) -> None:
         """Update the device state."""
 
+    def sensor_keys(self) -> tuple[BaseStationDeviceInfoKey, ...]:
+        """Return the device info keys that should be exposed as sensors."""
+        return self.INFO_KEYS
+
     def get_info(self, key: BaseStationDeviceInfoKey, default: Any | None = None) -> str | None:
         """Get device info by key."""
         return self._info.get(key, default)
@@ -158,11 +202,23 @@ class BasestationDevice(ABC):
 
     async def cleanup(self) -> None:
         """Clean up resources when device is being removed."""
+        self._closed = True
+        # Shared reads and writes are shielded from their callers, so stop them here
+        tasks = list(self._in_flight.values())
+        self._in_flight.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._idle_disconnect is not None:
+            self._idle_disconnect.cancel()
+            self._idle_disconnect = None
+
         async with self._client_lock:
             if self._current_client and self._current_client.is_connected:
                 try:
                     await self._current_client.disconnect()
-                except Exception as e:
+                except (BleakError, TimeoutError, OSError) as e:
                     _LOGGER.debug("Error disconnecting client during cleanup: %s", e)
                 finally:
                     self._current_client = None
@@ -171,7 +227,7 @@ class BasestationDevice(ABC):
         self._available = False
 
     def _should_attempt_connection(self) -> bool:
-        current_time = time.time()
+        current_time = self.hass.loop.time()
         if self._is_connecting:
             return False
 
@@ -185,11 +241,15 @@ class BasestationDevice(ABC):
         time_since_last_attempt = current_time - self._last_connection_attempt
         return time_since_last_attempt >= required_cooldown
 
+    def _is_reachable(self) -> bool:
+        """Return True if the device is connected or currently seen by the Bluetooth stack."""
+        return self._current_client is not None or self.get_ble_device() is not None
+
     def _record_connection_success(self) -> None:
         self._consecutive_failures = 0
         self._retry_count = 0
         self._available = True
-        self._last_successful_connection = time.time()
+        self._last_successful_connection = self.hass.loop.time()
 
     def _record_connection_failure(self) -> None:
         self._consecutive_failures += 1
@@ -198,10 +258,100 @@ class BasestationDevice(ABC):
             self._available = False
 
     def _update_power_state(self, state: int) -> None:
+        if state != self._last_power_state:
+            # Pass the raw code so formatting only happens when debug logging is enabled
+            _LOGGER.debug("Power state changed for %s: 0x%02x", self.mac, state)
         self._last_power_state = state
-        self._last_power_state_update = time.time()
+        self._last_power_state_update = self.hass.loop.time()
         self._is_on = state != 0x00
 
+    @asynccontextmanager
+    async def with_connection(self, connect_timeout: float | None = None) -> AsyncIterator[BleakClientWithServiceCache]:
+        """
+        Yield a connected client, reusing the connection of a recent operation.
+
+        The connection stays open for CONNECTION_IDLE_TIMEOUT seconds after the last user
+        releases it, so back-to-back reads from the power and info coordinators share one
+        connect. It is not held longer, as other hosts (e.g. SteamVR) need to reach the device.
+
+        connect_timeout bounds the connect itself; time spent queued behind other devices on the
+        same adapter does not count against it.
+        """
+        if self._idle_disconnect is not None:
+            self._idle_disconnect.cancel()
+            self._idle_disconnect = None
+
+        if self._closed:
+            msg = f"Device {self.mac} has been shut down"
+            raise BleakError(msg)
+
+        client = self._current_client
+        if client is None or not client.is_connected:
+            device = self.get_ble_device()
+            if not device:
+                msg = f"Device {self.mac} not found"
+                raise BleakNotFoundError(msg)
+
+            # Adapters handle one connection attempt at a time; queue here instead of failing in the stack
+            async with self._adapter_connect_lock(), asyncio.timeout(connect_timeout):
+                client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    device,
+                    device.name or device.address,
+                    disconnected_callback=self._handle_disconnect,
+                    max_attempts=1,
+                    use_services_cache=True,
+                )
+            if self._closed:
+                # cleanup() ran while this operation was connecting
+                await self._async_disconnect(client)
+                msg = f"Device {self.mac} has been shut down"
+                raise BleakError(msg)
+            self._current_client = client
+
+        self._connection_users += 1
+        try:
+            yield client
+        except (BleakError, TimeoutError, OSError, asyncio.CancelledError):
+            # Do not keep a connection around that just failed or abandoned an operation
+            self._current_client = None
+            await self._async_disconnect(client)
+            raise
+        finally:
+            self._connection_users -= 1
+            if self._connection_users == 0 and self._current_client is not None and not self._closed:
+                self._idle_disconnect = self.hass.loop.call_later(CONNECTION_IDLE_TIMEOUT, self._handle_idle_timeout)
+
+    def _adapter_connect_lock(self) -> asyncio.Lock:
+        """Return the lock shared by all basestations reached through the same adapter."""
+        service_info = bluetooth.async_last_service_info(self.hass, self.mac, connectable=True)
+        source = service_info.source if service_info else ""
+        locks: dict[str, asyncio.Lock] = self.hass.data.setdefault(DOMAIN, {}).setdefault("adapter_locks", {})
+        if (lock := locks.get(source)) is None:
+            lock = locks[source] = asyncio.Lock()
+        return lock
+
+    def _handle_idle_timeout(self) -> None:
+        self._idle_disconnect = None
+        if self._connection_users == 0 and (client := self._current_client) is not None:
+            self._current_client = None
+            self.hass.async_create_background_task(self._async_disconnect(client), f"{self.mac} idle disconnect")
+
+    async def _async_disconnect(self, client: BleakClientWithServiceCache) -> None:
+        try:
+            await client.disconnect()
+        except (BleakError, TimeoutError, OSError) as err:
+            _LOGGER.debug("Error disconnecting idle client for %s: %s", self.mac, err)
+
+    async def _join_in_flight[T](self, key: str, start: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Await the read in flight for key, starting it if there is none."""
+        task = self._in_flight.get(key)
+        if task is None or task.done():
+            task = self.hass.async_create_task(start(), f"{self.mac} {key} read", eager_start=True)
+            self._in_flight[key] = task
+        # Shield the shared read so one cancelled caller does not abort it for the others
+        return await asyncio.shield(task)
+
     @overload
     async def async_ble_operation(self, op: BLEOperationRead) -> bytearray | Literal[False]: ...
     @overload
@@ -212,34 +362,25 @@ class BasestationDevice(ABC):
             return False
 
         result: bool | bytearray
-        self._last_connection_attempt = time.time()
+        self._last_connection_attempt = self.hass.loop.time()
+
+        if not self._is_reachable():
+            # Not advertising: fail fast instead of spending connect attempts and retry delays
+            self._record_connection_failure()
+            return False
 
         async with self._client_lock:
             if self._is_connecting:
                 return False
             self._is_connecting = True
 
+        timeout = self.connection_timeout if op.timeout is None else min(op.timeout, self.connection_timeout)
         try:
             for attempt in range(MAX_RETRIES if op.retry else 1):
+                if attempt > 0:
+                    await asyncio.sleep(retry_delay(attempt))
                 try:
-                    await connect_delay(attempt)
-                    device = self.get_ble_device()
-                    if not device:
-                        continue
-
-                    client = await establish_connection(
-                        BleakClientWithServiceCache,
-                        device,
-                        device.name or device.address,
-                        disconnected_callback=self._handle_disconnect,
-                        max_attempts=1,
-                        use_services_cache=True,
-                    )
-
-                    async with client:
-                        async with self._client_lock:
-                            self._current_client = client
-
+                    async with self.with_connection(timeout) as client, asyncio.timeout(timeout):
                         if isinstance(op, BLEOperationRead):
                             result = await client.read_gatt_char(op.characteristic_uuid)
                         else:
@@ -254,12 +395,9 @@ class BasestationDevice(ABC):
                         return result
 
                 except BleakError as err:
-                    _LOGGER.debug("BLE error on %s: %s", self.mac, str(err))
-                except Exception as ex:
-                    _LOGGER.debug("Failed to execute op on %s: %s", self.mac, str(ex))
-
-                if attempt < (MAX_RETRIES if op.retry else 1) - 1:
-                    await asyncio.sleep(CONNECTION_DELAY)
+                    _LOGGER.debug("BLE error on %s: %s", self.mac, err)
+                except (TimeoutError, OSError) as ex:
+                    _LOGGER.debug("Failed to execute op on %s: %s", self.mac, ex)
 
             self._record_connection_failure()
             if self._consecutive_failures == MAX_CONSECUTIVE_FAILURES:
@@ -269,10 +407,11 @@ class BasestationDevice(ABC):
         finally:
             async with self._client_lock:
                 self._is_connecting = False
-                self._current_client = None
 
-    def _handle_disconnect(self, _client: BleakClientWithServiceCache) -> None:
+    def _handle_disconnect(self, client: BleakClientWithServiceCache) -> None:
         _LOGGER.debug("Device %s disconnected", self.mac)
+        if self._current_client is client:
+            self._current_client = None
 
     async def _read_standard_characteristics(
         self, client: BleakClientWithServiceCache, info: dict[BaseStationDeviceInfoKey, str]
@@ -287,50 +426,41 @@ class BasestationDevice(ABC):
                 (MANUFACTURER_CHARACTERISTIC, "manufacturer"),
             ),
         ):
+            if key in self._info:
+                # Static info does not change while the device runs
+                continue
             try:
                 if _value := await client.read_gatt_char(characteristic):
                     info[key] = _value.decode("utf-8").strip()
                     any_read_successful = True
-            except Exception:
+            except (BleakError, TimeoutError, OSError, UnicodeDecodeError):
                 _LOGGER.debug("Failed to read characteristic %s", key)
         return any_read_successful
 
     async def _attempt_device_info_read(self) -> dict[BaseStationDeviceInfoKey, str] | None:
-        device = self.get_ble_device()
-        if not device:
-            return None
-
         info: dict[BaseStationDeviceInfoKey, str] = {}
         try:
-            client = await establish_connection(
-                BleakClientWithServiceCache,
-                device,
-                device.name or device.address,
-                disconnected_callback=self._handle_disconnect,
-                max_attempts=1,
-                use_services_cache=True,
-            )
-
-            async with client:
-                async with self._client_lock:
-                    self._current_client = client
-
+            async with self.with_connection() as client:
                 std_success = await self._read_standard_characteristics(client, info)
                 spec_success = await self._read_specific_info(client, info)
 
-                if std_success or spec_success:
+                # Known keys are skipped, so a connected read of nothing new still counts as success
+                # once the device has answered before; only a device that never answered has failed
+                if std_success or spec_success or self._info:
                     return info
-        except Exception as err:
+        except (BleakError, TimeoutError, OSError) as err:
             _LOGGER.debug("Failed to read device info: %s", err)
         finally:
             async with self._client_lock:
                 self._is_connecting = False
-                self._current_client = None
         return None
 
     async def read_device_info(self, /, *, force: bool = False) -> dict[BaseStationDeviceInfoKey, str]:
-        """Read device information characteristics."""
-        current_time = time.time()
+        """Read device information characteristics, joining a read that is already in flight."""
+        return await self._join_in_flight("info", lambda: self._read_device_info(force=force))
+
+    async def _read_device_info(self, *, force: bool) -> dict[BaseStationDeviceInfoKey, str]:
+        current_time = self.hass.loop.time()
         if (
             not force
             and self._device_info_read_success
@@ -338,26 +468,35 @@ class BasestationDevice(ABC):
         ):
             return self._info
 
-        if not self._should_attempt_connection():
+        # Nothing to do if everything left to read is static and already known
+        static_info_complete = not self.VOLATILE_INFO_KEYS and self._info.keys() >= set(self.sensor_keys())
+        if static_info_complete or not self._should_attempt_connection():
+            return self._info
+
+        if not self._is_reachable():
+            self._last_connection_attempt = self.hass.loop.time()
+            self._record_connection_failure()
             return self._info
 
         for attempt in range(INFO_READ_RETRIES):
             if attempt > 0:
-                await asyncio.sleep(CONNECTION_DELAY * (2**attempt))
+                if self.hass.is_stopping:
+                    break
+                await asyncio.sleep(retry_delay(attempt))
 
-            self._last_connection_attempt = time.time()
+            self._last_connection_attempt = self.hass.loop.time()
             async with self._client_lock:
                 if self._is_connecting:
                     return self._info
                 self._is_connecting = True
 
             info = await self._attempt_device_info_read()
-            if info:
+            if info is not None:
                 self._info |= info
                 self._record_connection_success()
                 self._last_device_info_read = current_time
                 self._device_info_read_success = True
-                return info
+                return self._info
 
             self._record_connection_failure()
 
@@ -373,6 +512,10 @@ class BasestationDevice(ABC):
 class ValveBasestationDevice(BasestationDevice):
     """Valve Index Basestation (V2) device."""
 
+    INFO_KEYS = (*BasestationDevice.INFO_KEYS, "channel")
+    HAS_POWER_STATE = True
+    VOLATILE_INFO_KEYS = frozenset({"channel"})
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -382,6 +525,8 @@ class ValveBasestationDevice(BasestationDevice):
     ) -> None:
         """Initialize the Valve basestation device."""
         super().__init__(hass, mac, name, connection_timeout)
+        # Power command waiting to be written, as (value, resulting state)
+        self._pending_power_write: tuple[bytes, int] | None = None
 
     @property
     def default_name(self) -> str:
@@ -395,37 +540,43 @@ class ValveBasestationDevice(BasestationDevice):
 
     async def turn_on(self) -> None:
         """Turn on the device."""
-        result = await self.async_ble_operation(BLEOperationWrite(V2_PWR_CHARACTERISTIC, V2_PWR_ON))
-        if result:
-            self._update_power_state(0x0B)
+        await self._request_power_state(V2_PWR_ON, 0x0B)
 
     async def turn_off(self) -> None:
         """Turn off the device."""
-        result = await self.async_ble_operation(BLEOperationWrite(V2_PWR_CHARACTERISTIC, V2_PWR_SLEEP))
-        if result:
-            self._update_power_state(0x00)
+        await self._request_power_state(V2_PWR_SLEEP, 0x00)
 
     async def update(self) -> None:
         """Update the device state."""
-        value = await self.async_ble_operation(BLEOperationRead(V2_PWR_CHARACTERISTIC))
+        await self._join_in_flight("power", self._read_power_state)
+
+    async def _request_power_state(self, value: bytes, state: int) -> None:
+        # The latest request wins: a command sent while a write is in flight replaces any
+        # not yet written one and is written as soon as the current write finishes
+        self._pending_power_write = (value, state)
+        await self._join_in_flight("power_write", self._write_pending_power_states)
+
+    async def _write_pending_power_states(self) -> None:
+        while (pending := self._pending_power_write) is not None:
+            self._pending_power_write = None
+            value, state = pending
+            if await self.async_ble_operation(BLEOperationWrite(V2_PWR_CHARACTERISTIC, value)):
+                self._update_power_state(state)
+
+    async def _read_power_state(self) -> int | None:
+        # Scheduled polls fail fast; the coordinator tries again on its next refresh. The limit still
+        # grows with the configured timeout, for devices reached through slow proxies.
+        timeout = max(POLL_TIMEOUT, self.connection_timeout / 2)
+        op = BLEOperationRead(V2_PWR_CHARACTERISTIC, retry=False, timeout=timeout)
+        value = await self.async_ble_operation(op)
         if value and len(value) > 0:
             self._update_power_state(value[0])
-
-    async def get_raw_power_state(self) -> int | None:
-        """Get the raw power state value."""
-        if self._last_power_state is not None:
-            return self._last_power_state
-        value = await self.async_ble_operation(BLEOperationRead(V2_PWR_CHARACTERISTIC))
-        if value is not False and len(value) > 0:
-            self._update_power_state(value[0])
             return value[0]
         return None
 
     async def set_standby(self) -> None:
         """Set the device to standby mode."""
-        result = await self.async_ble_operation(BLEOperationWrite(V2_PWR_CHARACTERISTIC, V2_PWR_STANDBY))
-        if result:
-            self._update_power_state(0x02)
+        await self._request_power_state(V2_PWR_STANDBY, 0x02)
 
     async def identify(self) -> None:
         """Make the device blink its LED to identify it."""
@@ -439,7 +590,7 @@ class ValveBasestationDevice(BasestationDevice):
             if channel:
                 info["channel"] = int.from_bytes(channel, byteorder="big")
                 return True
-        except Exception:
+        except (BleakError, TimeoutError, OSError):
             _LOGGER.debug("Failed to read channel")
         return False
 
@@ -447,6 +598,8 @@ class ValveBasestationDevice(BasestationDevice):
 class ViveBasestationDevice(BasestationDevice):
     """Vive Basestation (V1) device."""
 
+    INFO_KEYS = (*BasestationDevice.INFO_KEYS, "pair_id")
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -466,6 +619,12 @@ class ViveBasestationDevice(BasestationDevice):
         """Return the default name."""
         return "Vive Basestation"
 
+    def sensor_keys(self) -> tuple[BaseStationDeviceInfoKey, ...]:
+        """Return the device info keys, omitting the pair ID when none is configured."""
+        if self.pair_id:
+            return self.INFO_KEYS
+        return BasestationDevice.INFO_KEYS
+
     async def turn_on(self) -> None:
         """Turn on the device."""
         if not self.pair_id:
@@ -528,8 +687,7 @@ def get_basestation_device(
     return ValveBasestationDevice(hass, mac, name, connection_timeout=connection_timeout)
 
 
-async def connect_delay(attempt: int) -> None:
-    """Delay based on prior connection attempts."""
-    if attempt > 0:
-        await asyncio.sleep(CONNECTION_DELAY * (2**attempt))
-    await asyncio.sleep(CONNECTION_DELAY * 0.5)
+def retry_delay(attempt: int) -> float:
+    """Return a jittered exponential backoff delay, capped at MAX_RETRY_DELAY."""
+    # Jitter keeps several basestations retrying after the same outage from hitting the adapter in lockstep
+    return min(MAX_RETRY_DELAY, CONNECTION_DELAY * (2**attempt)) * random.uniform(0.5, 1.0)  # noqa: S311
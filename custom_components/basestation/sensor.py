@@ -1,40 +1,81 @@
 """Sensor component for basestation integration."""
 
-import asyncio
 import logging
-import time
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import cast
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNKNOWN, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    DOMAIN,
-    INITIAL_RETRY_DELAY,
-    MAX_INITIAL_RETRIES,
-    V2_STATE_DESCRIPTIONS,
-)
-from .coordinator import BasestationCoordinator
-from .device import BasestationDevice, ValveBasestationDevice, ViveBasestationDevice
+from .const import DOMAIN, V2_STATE_DESCRIPTIONS
+from .coordinator import BasestationCoordinator, BasestationInfoCoordinator
+from .device import BasestationDevice, BaseStationDeviceInfoKey, ValveBasestationDevice
 from .utils import get_sensor_device_config
 
-if TYPE_CHECKING:
-    from .device import BaseStationDeviceInfoKey
-
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_DESCRIPTIONS: dict[str, tuple[str, str]] = {
-    "firmware": ("Firmware", "mdi:developer-board"),
-    "model": ("Model", "mdi:card-text"),
-    "hardware": ("Hardware", "mdi:chip"),
-    "manufacturer": ("Manufacturer", "mdi:factory"),
-    "channel": ("Channel", "mdi:radio-tower"),
-    "pair_id": ("Pair ID", "mdi:key-variant"),
-}
+
+@dataclass(frozen=True, kw_only=True)
+class BasestationSensorEntityDescription(SensorEntityDescription):
+    """Describes a basestation info sensor."""
+
+    # Other info keys exposed as state attributes of this sensor
+    attribute_keys: tuple[BaseStationDeviceInfoKey, ...] = ()
+
+
+# The firmware sensor carries the remaining static info as attributes, so the
+# dedicated model/hardware/manufacturer sensors are disabled by default.
+SENSOR_DESCRIPTIONS: MappingProxyType[str, BasestationSensorEntityDescription] = MappingProxyType(
+    {
+        "firmware": BasestationSensorEntityDescription(
+            key="firmware",
+            name="Firmware",
+            icon="mdi:developer-board",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            attribute_keys=("model", "hardware", "manufacturer"),
+        ),
+        "model": BasestationSensorEntityDescription(
+            key="model",
+            name="Model",
+            icon="mdi:card-text",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+        "hardware": BasestationSensorEntityDescription(
+            key="hardware",
+            name="Hardware",
+            icon="mdi:chip",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+        "manufacturer": BasestationSensorEntityDescription(
+            key="manufacturer",
+            name="Manufacturer",
+            icon="mdi:factory",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+        "channel": BasestationSensorEntityDescription(
+            key="channel",
+            name="Channel",
+            icon="mdi:radio-tower",
+        ),
+        "pair_id": BasestationSensorEntityDescription(
+            key="pair_id",
+            name="Pair ID",
+            icon="mdi:key-variant",
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    }
+)
+
+# Documented power states; undocumented codes are reported as unknown
+_POWER_STATE_OPTIONS = list(dict.fromkeys(V2_STATE_DESCRIPTIONS.values()))
 
 
 async def async_setup_entry(
@@ -48,140 +89,115 @@ async def async_setup_entry(
         return
     device: BasestationDevice = data["device"]
     coordinator: BasestationCoordinator = data["coordinator"]
+    info_coordinator: BasestationInfoCoordinator | None = data.get("info_coordinator")
 
     # Config holen
     device_config = get_sensor_device_config(entry)
     if not device_config:
         return
 
-    # Initial info read
-    if device_config["enable_info_sensors"]:
-        await _perform_initial_device_info_read(device)
-
-    entities: list[SensorEntity] = []
-
-    # Info Sensors (Static, slow polling)
-    if device_config["enable_info_sensors"]:
-        entities.extend(
-            [
-                BasestationInfoSensor(
-                    device,
-                    "firmware",
-                    device_config["info_scan_interval"],
-                    EntityCategory.DIAGNOSTIC,
-                ),
-                BasestationInfoSensor(
-                    device,
-                    "model",
-                    device_config["info_scan_interval"],
-                    EntityCategory.DIAGNOSTIC,
-                ),
-                BasestationInfoSensor(
-                    device,
-                    "hardware",
-                    device_config["info_scan_interval"],
-                    EntityCategory.DIAGNOSTIC,
-                ),
-                BasestationInfoSensor(
-                    device,
-                    "manufacturer",
-                    device_config["info_scan_interval"],
-                    EntityCategory.DIAGNOSTIC,
-                ),
-            ]
-        )
-
-        if isinstance(device, ValveBasestationDevice):
-            entities.append(BasestationInfoSensor(device, "channel", device_config["info_scan_interval"]))
-        elif isinstance(device, ViveBasestationDevice) and device.pair_id:
-            entities.append(
-                BasestationInfoSensor(
-                    device,
-                    "pair_id",
-                    device_config["info_scan_interval"],
-                    EntityCategory.DIAGNOSTIC,
-                )
-            )
+    # Info Sensors (Static, slow polling via the info coordinator, only created when they are enabled)
+    entities: list[SensorEntity] = (
+        [BasestationInfoSensor(info_coordinator, device, SENSOR_DESCRIPTIONS[key]) for key in device.sensor_keys()]
+        if info_coordinator is not None
+        else []
+    )
 
     # Power State Sensor (Fast polling via Coordinator)
-    if isinstance(device, ValveBasestationDevice) and device_config["enable_power_state_sensor"]:
-        entities.append(BasestationPowerStateSensor(coordinator, device))
+    if device.HAS_POWER_STATE and device_config["enable_power_state_sensor"]:
+        entities.append(BasestationPowerStateSensor(coordinator, cast("ValveBasestationDevice", device)))
 
     async_add_entities(entities)
 
 
-async def _perform_initial_device_info_read(device: BasestationDevice) -> None:
-    """Perform initial device info read with retries."""
-    for retry in range(MAX_INITIAL_RETRIES):
-        try:
-            if retry > 0:
-                await asyncio.sleep(INITIAL_RETRY_DELAY * (retry + 1))
-            if await device.read_device_info(force=True):
-                break
-        except Exception as err:
-            _LOGGER.debug("Initial read failed (retry %s): %s", retry, err)
-
-
-class BasestationInfoSensor(SensorEntity):
+class BasestationInfoSensor(CoordinatorEntity, SensorEntity):
     """
     Sensor for static basestation information.
 
-    Not using coordinator as this data rarely changes and doesn't need 5s polling.
+    Uses its own coordinator as this data rarely changes and doesn't need 5s polling.
     """
 
+    __slots__ = ("_key", "_last_written")
+
+    entity_description: BasestationSensorEntityDescription
+
     def __init__(
         self,
+        coordinator: BasestationInfoCoordinator,
         device: BasestationDevice,
-        key: "BaseStationDeviceInfoKey",
-        scan_interval: int,
-        entity_category: EntityCategory | None = None,
+        description: BasestationSensorEntityDescription,
     ) -> None:
         """Initialize the info sensor."""
-        self._device = device
+        super().__init__(coordinator)
+        self.entity_description = description
+        key = cast("BaseStationDeviceInfoKey", description.key)
         self._key: BaseStationDeviceInfoKey = key
-        self._scan_interval = scan_interval
-        self._attr_unique_id = f"basestation_{device.mac}_{key}"
+        self._attr_unique_id = device.uid_prefix + key
         self._attr_has_entity_name = True
-        name, icon = SENSOR_DESCRIPTIONS.get(key, (key.capitalize(), "mdi:information"))
-        self._attr_name = name
-        self._attr_icon = icon
-        self._attr_entity_category = entity_category
-        self._attr_native_value = device.get_info(key, STATE_UNKNOWN)
-        self._last_update = 0.0
-        self._attr_device_info = {"identifiers": {(DOMAIN, device.mac)}}
-
-    async def async_update(self) -> None:
-        """Update the sensor value."""
-        current_time = time.time()
-        if current_time - self._last_update < self._scan_interval and self._attr_native_value != STATE_UNKNOWN:
+        self._attr_device_info = device.device_info
+        # State, attributes and availability last written to Home Assistant
+        self._last_written: tuple[bool, str | None, dict[str, str] | None] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the value, its attributes or availability changed."""
+        available = self.available
+        written = (available, self.native_value if available else None, self.extra_state_attributes)
+        if written == self._last_written:
             return
+        self._last_written = written
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return True once the info coordinator has completed a read."""
+        return super().available and self.coordinator.data is not None
+
+    @property
+    def native_value(self) -> str:
+        """Return the info value read by the info coordinator."""
+        return self.coordinator.data.get(self._key, STATE_UNKNOWN)
 
-        try:
-            await self._device.read_device_info(force=False)
-            self._attr_native_value = self._device.get_info(self._key)
-            self._last_update = current_time
-        except Exception as err:
-            _LOGGER.debug("Error updating info sensor %s: %s", self.name, err)
+    @property
+    def extra_state_attributes(self) -> dict[str, str] | None:
+        """Return the other info values carried by this sensor."""
+        data = self.coordinator.data
+        if not (keys := self.entity_description.attribute_keys) or data is None:
+            return None
+        return {key: data[key] for key in keys if key in data}
 
 
 class BasestationPowerStateSensor(CoordinatorEntity, SensorEntity):
     """Sensor for basestation power state using the DataUpdateCoordinator."""
 
-    def __init__(self, coordinator: BasestationCoordinator, device: BasestationDevice) -> None:
+    __slots__ = ("_device", "_last_written")
+
+    def __init__(self, coordinator: BasestationCoordinator, device: ValveBasestationDevice) -> None:
         """Initialize the power state sensor."""
         super().__init__(coordinator)
         self._device = device
-        self._attr_unique_id = f"basestation_{device.mac}_power_state"
+        self._attr_unique_id = device.uid_prefix + "power_state"
         self._attr_has_entity_name = True
         self._attr_name = "Power State"
         self._attr_icon = "mdi:power-settings"
-        self._attr_device_info = {"identifiers": {(DOMAIN, device.mac)}}
+        self._attr_device_class = SensorDeviceClass.ENUM
+        self._attr_options = _POWER_STATE_OPTIONS
+        self._attr_device_info = device.device_info
+        # State and availability last written to Home Assistant
+        self._last_written: tuple[str | None, bool] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the power state or availability changed."""
+        written = (self.native_value, self.available)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
 
     @property
-    def native_value(self) -> str:
+    def native_value(self) -> str | None:
         """Return the state based on coordinator data."""
         # Coordinator calls device.update(), so device.last_power_state is fresh
         val = self._device.last_power_state
-        if val is None:
-            return STATE_UNKNOWN
-        return V2_STATE_DESCRIPTIONS.get(val, f"Unknown ({hex(val)})")
+        return None if val is None else V2_STATE_DESCRIPTIONS.get(val)
@@ -5,8 +5,8 @@ from typing import cast
 
 import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import entity_platform
 
+from .const import DOMAIN
 from .device import ValveBasestationDevice
 from .switch import BasestationSwitch
 
@@ -15,6 +15,10 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for basestation integration."""
+    # Every config entry calls this; register only once
+    if hass.services.has_service(DOMAIN, "identify"):
+        return
+
     # Register services
     hass.services.async_register(
         "basestation",
@@ -68,12 +72,5 @@ async def handle_set_standby_service(call: ServiceCall) -> None:
 def _retrieve_entity(call: ServiceCall) -> tuple[str, BasestationSwitch | None]:
     """Return entity instance requested by service call."""
     entity_id = cast("str", call.data.get("entity_id"))
-
-    # get all our platforms
-    platforms = entity_platform.async_get_platforms(call.hass, "basestation")
-
-    for platform in platforms:
-        if (entity := platform.entities.get(entity_id)) is not None and isinstance(entity, BasestationSwitch):
-            return entity_id, entity
-
-    return entity_id, None
+    switches: dict[str, BasestationSwitch] = call.hass.data.get(DOMAIN, {}).get("switches", {})
+    return entity_id, switches.get(entity_id)
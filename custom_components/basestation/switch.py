@@ -39,6 +39,8 @@ async def async_setup_entry(
 class BasestationSwitch(CoordinatorEntity, SwitchEntity):
     """Representation of a basestation main power switch."""
 
+    __slots__ = ("_device",)
+
     def __init__(self, coordinator: BasestationCoordinator, device: BasestationDevice) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
@@ -55,13 +57,17 @@ class BasestationSwitch(CoordinatorEntity, SwitchEntity):
             "serial_number": device.mac,
         }
 
+    async def async_added_to_hass(self) -> None:
+        """Register the switch so services can look it up by entity ID."""
+        await super().async_added_to_hass()
+        switches: dict[str, BasestationSwitch] = self.hass.data[DOMAIN].setdefault("switches", {})
+        entity_id = self.entity_id
+        switches[entity_id] = self
+        self.async_on_remove(lambda: switches.pop(entity_id, None))
+
     @property
     def is_on(self) -> bool:
         """Return if the switch is currently on or off."""
-        if isinstance(self._device, ValveBasestationDevice):
-            if self._device.last_power_state is None:
-                return False
-            return self._device.last_power_state != 0x00
         return self._device.is_on
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
@@ -78,31 +84,29 @@ class BasestationSwitch(CoordinatorEntity, SwitchEntity):
 class BasestationStandbySwitch(CoordinatorEntity, SwitchEntity):
     """Representation of a basestation standby switch (V2 only)."""
 
-    def __init__(self, coordinator: BasestationCoordinator, device: BasestationDevice) -> None:
+    __slots__ = ("_device",)
+
+    def __init__(self, coordinator: BasestationCoordinator, device: ValveBasestationDevice) -> None:
         """Initialize the standby switch."""
         super().__init__(coordinator)
         self._device = device
-        self._attr_unique_id = f"basestation_{device.mac}_standby"
+        self._attr_unique_id = device.uid_prefix + "standby"
         self._attr_has_entity_name = True
         self._attr_name = "Standby Mode"
         self._attr_icon = "mdi:sleep"
-        self._attr_device_info = {"identifiers": {(DOMAIN, device.mac)}}
+        self._attr_device_info = device.device_info
 
     @property
     def is_on(self) -> bool:
         """Return if the standby mode is active."""
-        if isinstance(self._device, ValveBasestationDevice):
-            return self._device.is_in_standby
-        return False
+        return self._device.is_in_standby
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn on standby mode."""
-        if isinstance(self._device, ValveBasestationDevice):
-            await self._device.set_standby()
-            await self.coordinator.async_request_refresh()
+        await self._device.set_standby()
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn off standby mode (turn fully on)."""
-        if isinstance(self._device, ValveBasestationDevice):
-            await self._device.turn_on()
-            await self.coordinator.async_request_refresh()
+        await self._device.turn_on()
+        await self.coordinator.async_request_refresh()
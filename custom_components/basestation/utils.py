@@ -11,13 +11,11 @@ from .const import (
     CONF_CONNECTION_TIMEOUT,
     CONF_DEVICE_TYPE,
     CONF_ENABLE_INFO_SENSORS,
-    CONF_INFO_SCAN_INTERVAL,
     CONF_PAIR_ID,
     CONF_POWER_STATE_SCAN_INTERVAL,
     CONF_SETUP_METHOD,
     DEFAULT_CONNECTION_TIMEOUT,
     DEFAULT_ENABLE_INFO_SENSORS,
-    DEFAULT_INFO_SCAN_INTERVAL,
     DEFAULT_POWER_STATE_SCAN_INTERVAL,
 )
 
@@ -84,7 +82,8 @@ def get_sensor_device_config(entry: ConfigEntry) -> dict[str, Any] | None:
     Extract full device configuration including sensor-specific options.
 
     This function is used by the sensor platform which needs additional
-    configuration for scan intervals and sensor enablement.
+    configuration for sensor enablement. The info scan interval is applied
+    by the info coordinator set up in __init__.py.
 
     Args:
         entry: The config entry to extract data from
@@ -104,7 +103,6 @@ def get_sensor_device_config(entry: ConfigEntry) -> dict[str, Any] | None:
     enable_info_sensors = options.get(CONF_ENABLE_INFO_SENSORS, DEFAULT_ENABLE_INFO_SENSORS)
     # Power state sensor is always enabled (critical for optimal performance)
     enable_power_state_sensor = True
-    info_scan_interval = options.get(CONF_INFO_SCAN_INTERVAL, DEFAULT_INFO_SCAN_INTERVAL)
     power_state_scan_interval = options.get(CONF_POWER_STATE_SCAN_INTERVAL, DEFAULT_POWER_STATE_SCAN_INTERVAL)
 
     _LOGGER.info(
@@ -120,6 +118,5 @@ def get_sensor_device_config(entry: ConfigEntry) -> dict[str, Any] | None:
         **basic_config,
         "enable_info_sensors": enable_info_sensors,
         "enable_power_state_sensor": enable_power_state_sensor,
-        "info_scan_interval": info_scan_interval,
         "power_state_scan_interval": power_state_scan_interval,
     }